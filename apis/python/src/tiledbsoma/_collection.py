@@ -16,6 +16,7 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
     Set,
     Tuple,
@@ -424,15 +425,7 @@ class CollectionBase(
         except KeyError:
             raise KeyError(err_str) from None
         if entry.soma is None:
-            from . import _factory  # Delayed binding to resolve circular import.
-
-            entry.soma = _factory._open_internal(
-                entry.entry.wrapper_type.open,
-                entry.entry.uri,
-                self.mode,
-                self.context,
-                self.tiledb_timestamp_ms,
-            )
+            entry.soma = self._open_member(entry.entry)
             # Since we just opened this object, we own it and should close it.
             self._close_stack.enter_context(entry.soma)
         return cast(CollectionElementType, entry.soma)
@@ -527,6 +520,30 @@ class CollectionBase(
             count = f"{n} items"
         return f"{start} ({count})"
 
+    def _member_entries(self) -> List[Tuple[str, _tdb_handles.GroupEntry]]:
+        """Returns a snapshot of the ``(key, entry)`` pair of each member.
+
+        Together with :meth:`_open_member`, this lets members be opened from other
+        threads, without going through the member cache (which is not thread-safe).
+        """
+        return [(key, elem.entry) for key, elem in self._contents.items()]
+
+    def _open_member(self, entry: _tdb_handles.GroupEntry) -> AnyTileDBObject:
+        """Opens the member described by ``entry``, in this collection's mode and at
+        its timestamp, bypassing the member cache.
+
+        The caller owns the returned object and must close it.
+        """
+        from . import _factory  # Delayed binding to resolve circular import.
+
+        return _factory._open_internal(
+            entry.wrapper_type.open,
+            entry.uri,
+            self.mode,
+            self.context,
+            self.tiledb_timestamp_ms,
+        )
+
     def _contents_lines(self, last_indent: str) -> Iterable[str]:
         indent = last_indent + "    "
         if self.closed:
@@ -117,7 +117,7 @@ class QueryCondition:
     def __attrs_post_init__(self):
         try:
             self.tree = ast.parse(self.expression, mode="eval")
-        except Exception as pex:
+        except (SyntaxError, ValueError) as pex:
             raise SOMAError(
                 "Could not parse the given QueryCondition statement: "
                 f"{self.expression}"
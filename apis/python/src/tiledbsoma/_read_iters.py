@@ -21,6 +21,8 @@ from ._types import NTuple
 class TableReadIter(somacore.ReadIter[pa.Table]):
     """Iterator over `Arrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`_ elements"""
 
+    __slots__ = ("sr",)
+
     def __init__(self, sr: clib.SOMAArray):
         self.sr = sr
 
@@ -42,6 +44,8 @@ RT = TypeVar("RT")
 class SparseTensorReadIterBase(somacore.ReadIter[RT], metaclass=abc.ABCMeta):
     """Private implementation class"""
 
+    __slots__ = ("sr", "shape")
+
     def __init__(self, sr: clib.SOMAArray, shape: NTuple):
         self.sr = sr
         self.shape = shape
@@ -70,6 +74,8 @@ class SparseTensorReadIterBase(somacore.ReadIter[RT], metaclass=abc.ABCMeta):
 class SparseCOOTensorReadIter(SparseTensorReadIterBase[pa.SparseCOOTensor]):
     """Iterator over `Arrow SparseCOOTensor <https://arrow.apache.org/docs/cpp/api/tensor.html>`_ elements"""
 
+    __slots__ = ()
+
     def _from_table(self, arrow_table: pa.Table) -> pa.SparseCOOTensor:
         coo_data = arrow_table.column("soma_data").to_numpy()
         coo_coords = np.array(
@@ -232,10 +232,9 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
 
             # Write bounding-box metadata
             maxes = []
-            for i in range(coord_tbl.num_columns):
-                coords = values.column(f"soma_dim_{i}").to_pylist()
-                if coords:
-                    maxes.append(max(coords))
+            for coord in coords:
+                if len(coord):
+                    maxes.append(int(coord.max()))
                 else:  # completely empty X
                     maxes.append(0)
             bounding_box = self._compute_bounding_box_metadata(maxes)
@@ -312,16 +311,17 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
         Retrieve the range of indexes for a dimension that were explicitly written.
         Compare this to ``shape`` which returns the available/writable capacity.
         """
+        # The bounding box lives in the metadata of our own, already-open handle:
+        # there is no need to open the array again to read it.
         retval = []
-        with tiledb.open(self.uri, ctx=self.context.tiledb_ctx):
-            for i in range(20):
-                lower_key = f"soma_dim_{i}_domain_lower"
-                lower_val = self.metadata.get(lower_key)
-                upper_key = f"soma_dim_{i}_domain_upper"
-                upper_val = self.metadata.get(upper_key)
-                if lower_val is None or upper_val is None:
-                    break
-                retval.append((lower_val, upper_val))
+        for i in range(20):
+            lower_key = f"soma_dim_{i}_domain_lower"
+            lower_val = self.metadata.get(lower_key)
+            upper_key = f"soma_dim_{i}_domain_upper"
+            upper_val = self.metadata.get(upper_key)
+            if lower_val is None or upper_val is None:
+                break
+            retval.append((lower_val, upper_val))
         if not retval:
             raise SOMAError(
                 f"Array {self.uri} was not written with bounding box support. "
@@ -346,6 +346,10 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
         leading/trailing rows/columns of the sparse array are entirely unoccupied, this
         function will return a tighter range.
         """
+        if self.mode == "r":
+            # Reuse our own read handle (and its timestamp) rather than
+            # opening the array again on every call.
+            return self._handle.reader.nonempty_domain()  # type: ignore
         with tiledb.open(self.uri, ctx=self.context.tiledb_ctx) as A:
             return A.nonempty_domain()  # type: ignore
 
@@ -396,6 +400,8 @@ class SparseNDArrayRead(somacore.SparseRead):
         Experimental.
     """
 
+    __slots__ = ("sr", "shape")
+
     def __init__(self, sr: clib.SOMAArray, shape: NTuple):
         """
         Lifecycle:
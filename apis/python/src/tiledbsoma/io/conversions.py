@@ -6,11 +6,12 @@
 """Conversion utility methods.
 """
 
-from typing import TypeVar, cast
+from typing import Iterable, List, Tuple, TypeVar, cast
 
 import numpy as np
 import pandas as pd
 import pandas._typing as pdt
+import pyarrow as pa
 import scipy.sparse as sp
 from pandas.api.types import is_categorical_dtype
 
@@ -20,6 +21,7 @@ from .._types import NPNDArray, PDSeries
 _DT = TypeVar("_DT", bound=pdt.Dtype)
 _MT = TypeVar("_MT", NPNDArray, sp.spmatrix, PDSeries)
 _str_to_type = {"boolean": bool, "string": str, "bytes": bytes}
+_COO_COLUMNS = ("soma_data", "soma_dim_0", "soma_dim_1")
 
 
 def decategoricalize_obs_or_var(obs_or_var: pd.DataFrame) -> pd.DataFrame:
@@ -82,3 +84,60 @@ def csr_from_tiledb_df(df: pd.DataFrame, num_rows: int, num_cols: int) -> sp.csr
         (df["soma_data"], (df["soma_dim_0"], df["soma_dim_1"])),
         shape=(num_rows, num_cols),
     )
+
+
+def csr_from_tiledb_table(
+    table: pa.Table, num_rows: int, num_cols: int
+) -> sp.csr_matrix:
+    """Given an Arrow table of ``soma_dim_0``, ``soma_dim_1``, ``soma_data``
+    triples as read from a ``SparseNDArray``, return a ``scipy.sparse.csr_matrix``.
+
+    Unlike :func:`csr_from_tiledb_df`, this builds the matrix straight from the
+    Arrow columns, without materializing an intermediate ``pandas.DataFrame``.
+    """
+    return sp.csr_matrix(
+        (
+            table.column("soma_data").to_numpy(),
+            (
+                table.column("soma_dim_0").to_numpy(),
+                table.column("soma_dim_1").to_numpy(),
+            ),
+        ),
+        shape=(num_rows, num_cols),
+    )
+
+
+def csr_from_tiledb_tables(
+    tables: Iterable[pa.Table], num_rows: int, num_cols: int
+) -> sp.csr_matrix:
+    """Like :func:`csr_from_tiledb_table`, but takes an iterable of Arrow tables,
+    such as ``SparseNDArray.read().tables()``, rather than their concatenation.
+
+    The numpy ``(data, i, j)`` columns of each table are zero-copy views of its Arrow
+    buffers, so every table is held until the columns are concatenated at the end:
+    peak memory is the same as for ``tables().concat()``.
+    """
+    columns: Tuple[List[NPNDArray], ...] = tuple([] for _ in _COO_COLUMNS)
+    for table in tables:
+        for column, name in zip(columns, _COO_COLUMNS):
+            column.append(table.column(name).to_numpy())
+
+    if not columns[0]:
+        return sp.csr_matrix((num_rows, num_cols))
+
+    data, dim_0, dim_1 = (np.concatenate(column) for column in columns)
+
+    row_step = np.diff(dim_0)
+    row_major = np.all((row_step > 0) | ((row_step == 0) & (dim_1[1:] > dim_1[:-1])))
+    # Only meaningful when row_major, as then dim_0's last value is its maximum.
+    in_bounds = len(dim_0) == 0 or (dim_0[-1] < num_rows and dim_1.max() < num_cols)
+    if row_major and in_bounds:
+        # Input strictly in row-major order (e.g. a row-major read of an array without
+        # duplicate coordinates) is already canonical CSR, so skip the COO-to-CSR sort
+        # and duplicate-summing, and derive the row pointers from the per-row counts.
+        # Out-of-range coordinates are left to the COO path, which rejects them.
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dim_0, minlength=num_rows), out=indptr[1:])
+        return sp.csr_matrix((data, dim_1, indptr), shape=(num_rows, num_cols))
+
+    return sp.csr_matrix((data, (dim_0, dim_1)), shape=(num_rows, num_cols))
@@ -11,10 +11,14 @@ other formats. Currently only ``.h5ad`` (`AnnData <https://anndata.readthedocs.i
 
 import math
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import (
     Any,
+    Callable,
     ContextManager,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -31,6 +35,7 @@ from unittest import mock
 import anndata as ad
 import h5py
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pyarrow as pa
 import scipy.sparse as sp
@@ -57,7 +62,7 @@ from .._common_nd_array import NDArray
 from .._constants import SOMA_JOINID
 from .._exception import DoesNotExistError, SOMAError
 from .._funcs import typeguard_ignore
-from .._tdb_handles import RawHandle
+from .._tdb_handles import GroupEntry, RawHandle
 from .._tiledb_array import TileDBArray
 from .._tiledb_object import AnyTileDBObject, TileDBObject
 from .._types import INGEST_MODES, IngestMode, NPNDArray, Path
@@ -78,6 +83,8 @@ DenseMatrix = Union[NPNDArray, h5py.Dataset]
 Matrix = Union[DenseMatrix, SparseMatrix]
 _NDArr = TypeVar("_NDArr", bound=NDArray)
 _TDBO = TypeVar("_TDBO", bound=TileDBObject[RawHandle])
+_A = TypeVar("_A")
+_R = TypeVar("_R")
 
 # ----------------------------------------------------------------
 class IngestionParams:
@@ -438,7 +445,7 @@ def from_anndata(
     # tiledb://namespace/s3://bucket/path/to/exp whereas experiment.ms.uri will
     # be of the form tiledb://namespace/uuid. Only for the former is it suitable
     # to append "/ms" so that is what we do here.
-    experiment_ms_uri = f"{experiment_uri}/ms"
+    experiment_ms_uri = _util.uri_joinpath(experiment_uri, "ms")
 
     with _create_or_open_collection(
         Collection[Measurement],
@@ -613,7 +620,6 @@ def from_anndata(
                                 )
 
                 if len(anndata.obsp.keys()) > 0:  # do not create an empty collection
-                    _util.uri_joinpath(measurement_uri, "obsp")
                     with _create_or_open_collection(
                         Collection,
                         _util.uri_joinpath(measurement.uri, "obsp"),
@@ -623,28 +629,17 @@ def from_anndata(
                         _maybe_set(
                             measurement, "obsp", obsp, use_relative_uri=use_relative_uri
                         )
-                        for key in anndata.obsp.keys():
-                            with _create_from_matrix(
-                                SparseNDArray,
-                                _util.uri_joinpath(obsp.uri, key),
-                                conversions.to_tiledb_supported_array_type(
-                                    key, anndata.obsp[key]
-                                ),
-                                ingestion_params=ingestion_params,
-                                platform_config=platform_config,
-                                context=context,
-                                axis_0_mapping=jidmaps.obs_axis,
-                                axis_1_mapping=jidmaps.obs_axis,
-                            ) as sarr:
-                                _maybe_set(
-                                    obsp,
-                                    key,
-                                    sarr,
-                                    use_relative_uri=use_relative_uri,
-                                )
+                        _write_obsp_or_varp(
+                            obsp,
+                            anndata.obsp,
+                            axis_mapping=jidmaps.obs_axis,
+                            ingestion_params=ingestion_params,
+                            platform_config=platform_config,
+                            context=context,
+                            use_relative_uri=use_relative_uri,
+                        )
 
                 if len(anndata.varp.keys()) > 0:  # do not create an empty collection
-                    _util.uri_joinpath(measurement_uri, "obsp")
                     with _create_or_open_collection(
                         Collection,
                         _util.uri_joinpath(measurement.uri, "varp"),
@@ -654,25 +649,15 @@ def from_anndata(
                         _maybe_set(
                             measurement, "varp", varp, use_relative_uri=use_relative_uri
                         )
-                        for key in anndata.varp.keys():
-                            with _create_from_matrix(
-                                SparseNDArray,
-                                _util.uri_joinpath(varp.uri, key),
-                                conversions.to_tiledb_supported_array_type(
-                                    key, anndata.varp[key]
-                                ),
-                                ingestion_params=ingestion_params,
-                                platform_config=platform_config,
-                                context=context,
-                                axis_0_mapping=jidmaps.var_axes[measurement_name],
-                                axis_1_mapping=jidmaps.var_axes[measurement_name],
-                            ) as sarr:
-                                _maybe_set(
-                                    varp,
-                                    key,
-                                    sarr,
-                                    use_relative_uri=use_relative_uri,
-                                )
+                        _write_obsp_or_varp(
+                            varp,
+                            anndata.varp,
+                            axis_mapping=jidmaps.var_axes[measurement_name],
+                            ingestion_params=ingestion_params,
+                            platform_config=platform_config,
+                            context=context,
+                            use_relative_uri=use_relative_uri,
+                        )
 
                 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
                 # MS/RAW
@@ -747,6 +732,95 @@ def from_anndata(
     return experiment.uri
 
 
+_MAX_CONCURRENT_MATRICES = 4
+"""The most obsp/varp matrices which are written, or read, at once."""
+
+
+def _run_bounded(
+    pool: ThreadPoolExecutor,
+    fn: Callable[[_A], _R],
+    items: Iterable[Tuple[str, _A]],
+) -> Iterator[Tuple[str, "Future[_R]"]]:
+    """
+    Runs ``fn`` on the value of each ``(key, value)`` item on ``pool``, and yields
+    ``(key, future)`` for each call as it completes.
+
+    At most ``_MAX_CONCURRENT_MATRICES`` calls are in flight at once, in a sliding
+    window: each call holds a whole matrix, so peak memory would otherwise grow with
+    the number of matrices (up to the size of the pool). If the caller stops early,
+    the calls already in flight are waited for, and no more are started.
+    """
+    pending: Dict["Future[_R]", str] = {}
+    try:
+        for key, value in items:
+            while len(pending) >= _MAX_CONCURRENT_MATRICES:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+            pending[pool.submit(fn, value)] = key
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+    finally:
+        wait(pending)
+
+
+def _write_obsp_or_varp(
+    collection: AnyTileDBCollection,
+    matrices: Mapping[str, Matrix],
+    *,
+    axis_mapping: AxisIDMapping,
+    ingestion_params: IngestionParams,
+    platform_config: Optional[PlatformConfig],
+    context: SOMATileDBContext,
+    use_relative_uri: Optional[bool],
+) -> None:
+    """
+    This is a helper function for ``from_anndata`` of ``obsp`` and ``varp`` elements.
+
+    Each matrix is an independent array write, so these are run concurrently on the
+    context's thread pool, at most ``_MAX_CONCURRENT_MATRICES`` at a time: each
+    write buffers up to ``goal_chunk_nnz`` cells, so peak memory would otherwise grow
+    with the number of matrices. Adding the new arrays to the collection is done on
+    this thread, as group membership updates must be serialized.
+    """
+    # Opt-in down-cast, e.g. of float64 distances or connectivities to float32. This
+    # is applied to each chunk as it is written, so it works for any input type.
+    value_type = TileDBCreateOptions.from_platform_config(
+        platform_config
+    ).obsp_varp_value_type
+
+    def _write(key: str) -> SparseNDArray:
+        return _create_from_matrix(
+            SparseNDArray,
+            _util.uri_joinpath(collection.uri, key),
+            conversions.to_tiledb_supported_array_type(key, matrices[key]),
+            ingestion_params=ingestion_params,
+            platform_config=platform_config,
+            context=context,
+            axis_0_mapping=axis_mapping,
+            axis_1_mapping=axis_mapping,
+            value_type=value_type,
+        )
+
+    # Let every write finish, even if one of them fails, so that none is left running
+    # after the collection is closed, and every array which was written is closed and
+    # added to the collection. Then re-raise the first error.
+    error: Optional[BaseException] = None
+    for key, future in _run_bounded(
+        context.threadpool, _write, ((key, key) for key in matrices)
+    ):
+        exc = future.exception()
+        if exc is not None:
+            error = error or exc
+            continue
+        with future.result() as sarr:
+            _maybe_set(collection, key, sarr, use_relative_uri=use_relative_uri)
+    if error is not None:
+        raise error
+
+
 def append_obs(
     exp: Experiment,
     new_obs: pd.DataFrame,
@@ -1261,10 +1335,17 @@ def _create_from_matrix(
     context: Optional[SOMATileDBContext] = None,
     axis_0_mapping: AxisIDMapping,
     axis_1_mapping: AxisIDMapping,
+    value_type: npt.DTypeLike = None,
 ) -> _NDArr:
     """
     Internal helper for user-facing ``create_from_matrix``.
+
+    If ``value_type`` is given, it is the value type of a new array, and the input's
+    values are cast to it chunk by chunk as they are written. Only ``SparseNDArray``
+    supports this.
     """
+    if value_type is not None and not cls.is_sparse:
+        raise TypeError(f"value_type is not supported for {cls.__name__}")
     # SparseDataset has no ndim but it has a shape
     if len(matrix.shape) != 2:
         raise ValueError(f"expected matrix.shape == 2; got {matrix.shape}")
@@ -1281,7 +1362,9 @@ def _create_from_matrix(
         shape = [None for _ in matrix.shape] if cls.is_sparse else matrix.shape
         soma_ndarray = cls.create(
             uri,
-            type=pa.from_numpy_dtype(matrix.dtype),
+            type=pa.from_numpy_dtype(
+                matrix.dtype if value_type is None else np.dtype(value_type)
+            ),
             shape=shape,
             platform_config=platform_config,
             context=context,
@@ -1323,6 +1406,7 @@ def _create_from_matrix(
             ingestion_params=ingestion_params,
             axis_0_mapping=axis_0_mapping,
             axis_1_mapping=axis_1_mapping,
+            value_type=value_type,
         )
     else:
         raise TypeError(f"unknown array type {type(soma_ndarray)}")
@@ -1689,7 +1773,7 @@ def _write_matrix_to_denseNDArray(
 
         chunk = matrix[i:i2, :]
 
-        if ingestion_params.skip_existing_nonempty_domain and storage_ned is not None:
+        if storage_ned is not None:
             chunk_bounds = matrix_bounds
             chunk_bounds[0] = (
                 int(i),
@@ -1728,13 +1812,10 @@ def _write_matrix_to_denseNDArray(
 
 
 def _read_nonempty_domain(arr: TileDBArray) -> Any:
-    try:
+    if arr.mode == "r":
         return arr._handle.reader.nonempty_domain()
-    except SOMAError:
-        # This means that we're open in write-only mode.
-        # Reopen the array in read mode.
-        pass
 
+    # We're open in write-only mode. Reopen the array in read mode.
     cls = type(arr)
     with cls.open(arr.uri, "r", platform_config=None, context=arr.context) as readarr:
         return readarr._handle.reader.nonempty_domain()
@@ -1798,6 +1879,34 @@ def _find_sparse_chunk_size(
     return chunk_size
 
 
+def _to_coo(matrix: Matrix, sum_duplicates: bool = True) -> sp.coo_matrix:
+    """Returns the (non-empty) entries of ``matrix`` as a ``scipy.sparse.coo_matrix``.
+    Unless ``sum_duplicates`` is false, any duplicate coordinates are summed (as scipy
+    does), so each cell is written once.
+
+    Sparse inputs are converted sparse-to-sparse, sharing the column indices and data
+    with the input where ``scipy`` allows: they are never routed through a dense array.
+    """
+    if isinstance(matrix, SparseDataset):
+        # Backed-mode AnnData; scipy.sparse does not know how to read these.
+        matrix = matrix.to_memory()
+    if not sp.issparse(matrix):
+        return sp.coo_matrix(matrix)
+
+    sparse = cast(sp.spmatrix, matrix)
+    # Only COO input, or CSR/CSC input not known to be canonical, can hold duplicate
+    # coordinates. Check the input's flag rather than that of the ``tocoo`` result,
+    # which not all scipy versions carry over, so that the common case skips the
+    # sort in sum_duplicates. (Formats without the flag, such as LIL and DOK, cannot
+    # hold duplicates.)
+    if not sum_duplicates or getattr(sparse, "has_canonical_format", True):
+        return sparse.tocoo(copy=False)
+    # Copy COO input so that coalescing it does not modify the caller's matrix.
+    coo = sparse.tocoo(copy=sparse.format == "coo")
+    coo.sum_duplicates()
+    return coo
+
+
 def _write_matrix_to_sparseNDArray(
     soma_ndarray: SparseNDArray,
     matrix: Matrix,
@@ -1806,13 +1915,14 @@ def _write_matrix_to_sparseNDArray(
     ingestion_params: IngestionParams,
     axis_0_mapping: AxisIDMapping,
     axis_1_mapping: AxisIDMapping,
+    value_type: npt.DTypeLike = None,
 ) -> None:
     """Write a matrix to an empty DenseNDArray"""
 
     def _coo_to_table(
         mat_coo: sp.coo_matrix,
-        axis_0_mapping: AxisIDMapping,
-        axis_1_mapping: AxisIDMapping,
+        axis_0_joinids: npt.NDArray[np.int64],
+        axis_1_joinids: npt.NDArray[np.int64],
         axis: int = 0,
         base: int = 0,
     ) -> pa.Table:
@@ -1821,12 +1931,17 @@ def _write_matrix_to_sparseNDArray(
         soma_dim_1 = mat_coo.col + base if base > 0 and axis == 1 else mat_coo.col
 
         # Apply registration mappings: e.g. columns 0,1,2,3 in an AnnData file might
-        # have been assigned gene-ID labels 22,197,438,988.
-        soma_dim_0 = [axis_0_mapping.data[e] for e in soma_dim_0]
-        soma_dim_1 = [axis_1_mapping.data[e] for e in soma_dim_1]
+        # have been assigned gene-ID labels 22,197,438,988. This is a single vectorized
+        # gather per axis, not a per-element Python lookup.
+        soma_dim_0 = axis_0_joinids[soma_dim_0]
+        soma_dim_1 = axis_1_joinids[soma_dim_1]
+
+        data = mat_coo.data
+        if value_type is not None:
+            data = data.astype(value_type, copy=False)
 
         pydict = {
-            "soma_data": mat_coo.data,
+            "soma_data": data,
             "soma_dim_0": soma_dim_0,
             "soma_dim_1": soma_dim_1,
         }
@@ -1859,10 +1974,24 @@ def _write_matrix_to_sparseNDArray(
             )
             return
 
+    # Convert the registration mappings to numpy once, up front, rather than per chunk.
+    # obsp/varp pass the same mapping for both axes: convert it only once.
+    axis_0_joinids = np.asarray(axis_0_mapping.data, dtype=np.int64)
+    if axis_1_mapping is axis_0_mapping:
+        axis_1_joinids = axis_0_joinids
+    else:
+        axis_1_joinids = np.asarray(axis_1_mapping.data, dtype=np.int64)
+
+    # An array created with allows_duplicates keeps every written cell, so leave
+    # any duplicates in the input for it to store as-is.
+    sum_duplicates = not tiledb_create_options.allows_duplicates
+
     # Write all at once?
     if not tiledb_create_options.write_X_chunked:
         soma_ndarray.write(
-            _coo_to_table(sp.coo_matrix(matrix), axis_0_mapping, axis_1_mapping)
+            _coo_to_table(
+                _to_coo(matrix, sum_duplicates), axis_0_joinids, axis_1_joinids
+            )
         )
         return
 
@@ -1881,6 +2010,9 @@ def _write_matrix_to_sparseNDArray(
     eta_tracker = eta.Tracker()
     goal_chunk_nnz = tiledb_create_options.goal_chunk_nnz
 
+    # Loop invariant: compute it once rather than for every chunk.
+    non_stride_axis = 1 - stride_axis
+
     coords = [slice(None), slice(None)]
     i = 0
     while i < dim_max_size:
@@ -1897,7 +2029,6 @@ def _write_matrix_to_sparseNDArray(
             # * This attains goal_chunk_nnz = 100_000_000 since we have 50M rows
             #   with 2 elements each
             # * Result: we divide by the shape, slotted by the non-stride axis
-            non_stride_axis = 1 - stride_axis
             chunk_size = int(math.ceil(goal_chunk_nnz / matrix.shape[non_stride_axis]))
         else:
             chunk_size = _find_sparse_chunk_size(  # type: ignore [unreachable]
@@ -1912,11 +2043,11 @@ def _write_matrix_to_sparseNDArray(
         i2 = i + chunk_size
 
         coords[stride_axis] = slice(i, i2)
-        chunk_coo = sp.coo_matrix(matrix[tuple(coords)])
+        chunk_coo = _to_coo(matrix[tuple(coords)], sum_duplicates)
 
         chunk_percent = min(100, 100 * (i2 - 1) / dim_max_size)
 
-        if ingestion_params.skip_existing_nonempty_domain and storage_ned is not None:
+        if storage_ned is not None:
             chunk_bounds = matrix_bounds
             chunk_bounds[stride_axis] = (
                 int(i),
@@ -1940,7 +2071,7 @@ def _write_matrix_to_sparseNDArray(
         )
 
         soma_ndarray.write(
-            _coo_to_table(chunk_coo, axis_0_mapping, axis_1_mapping, stride_axis, i)
+            _coo_to_table(chunk_coo, axis_0_joinids, axis_1_joinids, stride_axis, i)
         )
 
         t2 = time.time()
@@ -2365,8 +2496,8 @@ def to_anndata(
         X_ndarray = X_data.read((slice(None), slice(None))).to_numpy()
         X_dtype = X_ndarray.dtype
     elif isinstance(X_data, SparseNDArray):
-        X_mat = X_data.read().tables().concat().to_pandas()  # TODO: CSR/CSC options ...
-        X_csr = conversions.csr_from_tiledb_df(X_mat, nobs, nvar)
+        # TODO: CSR/CSC options ...
+        X_csr = conversions.csr_from_tiledb_tables(X_data.read().tables(), nobs, nvar)
         X_dtype = X_csr.dtype
     else:
         raise TypeError(f"Unexpected NDArray type {type(X_data)}")
@@ -2377,30 +2508,34 @@ def to_anndata(
     obsm = {}
     if "obsm" in measurement:
         obsm_width_hints = obsm_varm_width_hints.get("obsm", {})
-        for key in measurement.obsm.keys():
+        for key, member in _prefetch_members(measurement.obsm):
             obsm[key] = _extract_obsm_or_varm(
-                measurement.obsm[key], "obsm", key, nobs, obsm_width_hints
+                cast(Union[SparseNDArray, DenseNDArray], member),
+                "obsm",
+                key,
+                nobs,
+                obsm_width_hints,
             )
 
     varm = {}
     if "varm" in measurement:
         varm_width_hints = obsm_varm_width_hints.get("obsm", {})
-        for key in measurement.varm.keys():
+        for key, member in _prefetch_members(measurement.varm):
             varm[key] = _extract_obsm_or_varm(
-                measurement.varm[key], "varm", key, nvar, varm_width_hints
+                cast(Union[SparseNDArray, DenseNDArray], member),
+                "varm",
+                key,
+                nvar,
+                varm_width_hints,
             )
 
     obsp = {}
     if "obsp" in measurement:
-        for key in measurement.obsp.keys():
-            matrix = measurement.obsp[key].read().tables().concat().to_pandas()
-            obsp[key] = conversions.csr_from_tiledb_df(matrix, nobs, nobs)
+        obsp = _extract_obsp_or_varp(measurement.obsp, nobs)
 
     varp = {}
     if "varp" in measurement:
-        for key in measurement.varp.keys():
-            matrix = measurement.varp[key].read().tables().concat().to_pandas()
-            varp[key] = conversions.csr_from_tiledb_df(matrix, nvar, nvar)
+        varp = _extract_obsp_or_varp(measurement.varp, nvar)
 
     anndata = ad.AnnData(
         X=X_csr if X_csr is not None else X_ndarray,
@@ -2418,6 +2553,76 @@ def to_anndata(
     return anndata
 
 
+def _prefetch_members(
+    collection: AnyTileDBCollection,
+) -> Iterator[Tuple[str, AnyTileDBObject]]:
+    """
+    Yields ``(key, member)`` for each member of ``collection``, opened in its mode.
+
+    The open of the next member -- and with it, its schema and metadata loads -- is
+    issued on the context's thread pool before the current member is yielded, so
+    that those storage round-trips overlap the caller's work on the current one.
+    Members are opened with ``Collection._open_member``, bypassing the collection's
+    member cache (which is not thread-safe), and each is closed once the caller moves
+    past it.
+    """
+    pool = collection.context.threadpool
+    members = collection._member_entries()
+
+    def _submit(n: int) -> Optional["Future[AnyTileDBObject]"]:
+        if n >= len(members):
+            return None
+        return pool.submit(collection._open_member, members[n][1])
+
+    upcoming = _submit(0)
+    try:
+        for n, (key, _) in enumerate(members):
+            assert upcoming is not None
+            current, upcoming = upcoming, _submit(n + 1)
+            with current.result() as member:
+                yield key, member
+    finally:
+        # Don't leak the prefetched member if the caller stops early. If that open
+        # itself failed, drop its error rather than mask the one in flight (if any).
+        if upcoming is not None and upcoming.exception() is None:
+            upcoming.result().close()
+
+
+def _extract_obsp_or_varp(
+    collection: AnyTileDBCollection, num_rows: int
+) -> Dict[str, sp.csr_matrix]:
+    """
+    This is a helper function for ``to_anndata`` of ``obsp`` and ``varp`` elements.
+
+    The member arrays are read concurrently on the context's thread pool, at most
+    ``_MAX_CONCURRENT_MATRICES`` at a time: these reads are latency-bound on object
+    stores, and the native reader releases the GIL while it waits on storage.
+    """
+
+    # Each worker opens, reads, and closes its own member array, without going
+    # through the collection's member cache (which is not thread-safe) and without
+    # leaving the array open after.
+    def _read_csr(entry: GroupEntry) -> sp.csr_matrix:
+        with cast(SparseNDArray, collection._open_member(entry)) as soma_nd_array:
+            # Have the native reader return cells in row-major order: CSR assembly
+            # then only needs the row pointers, with no Python-side sort.
+            return conversions.csr_from_tiledb_tables(
+                soma_nd_array.read(result_order="row-major").tables(),
+                num_rows,
+                num_rows,
+            )
+
+    members = collection._member_entries()
+    results = {
+        key: future.result()
+        for key, future in _run_bounded(
+            collection.context.threadpool, _read_csr, members
+        )
+    }
+    # Calls complete in any order; return the matrices in member order.
+    return {key: results[key] for key, _ in members}
+
+
 def _extract_obsm_or_varm(
     soma_nd_array: Union[SparseNDArray, DenseNDArray],
     collection_name: str,
@@ -2441,7 +2646,7 @@ def _extract_obsm_or_varm(
         # 3.8 and we still support Python 3.7
         return matrix
 
-    matrix = soma_nd_array.read().tables().concat().to_pandas()
+    matrix = soma_nd_array.read().tables().concat()
 
     # Problem to solve: whereas for other sparse arrays we have:
     #
@@ -2473,7 +2678,7 @@ def _extract_obsm_or_varm(
             pass  # We tried; moving on to next option
 
     if num_cols is None:
-        num_rows_times_width, coo_column_count = matrix.shape
+        num_rows_times_width, coo_column_count = matrix.num_rows, matrix.num_columns
 
         if coo_column_count != 3:
             raise SOMAError(
@@ -2488,4 +2693,4 @@ def _extract_obsm_or_varm(
             f"could not determine outgest width for {description}: please try to_anndata's obsm_varm_width_hints option"
         )
 
-    return conversions.csr_from_tiledb_df(matrix, num_rows, num_cols).toarray()
+    return conversions.csr_from_tiledb_table(matrix, num_rows, num_cols).toarray()
@@ -7,6 +7,7 @@ import datetime
 import functools
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Mapping, Optional, Union
 
 import tiledb
@@ -65,6 +66,7 @@ class SOMATileDBContext:
         tiledb_ctx: Optional[tiledb.Ctx] = None,
         tiledb_config: Optional[Dict[str, Union[str, float]]] = None,
         timestamp: Optional[OpenTimestamp] = None,
+        threadpool: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initializes a new SOMATileDBContext.
 
@@ -108,6 +110,12 @@ class SOMATileDBContext:
                 Set to 0xFFFFFFFFFFFFFFFF (UINT64_MAX) to get the absolute
                 latest revision (i.e., including changes that occur "after"
                 the current wall time) as of when *each* object is opened.
+
+            threadpool: A thread pool to use for concurrent I/O, such as
+                reading the members of a collection in parallel. To bound
+                concurrency, pass e.g. ``ThreadPoolExecutor(max_workers=4)``.
+                If not provided, a pool with default settings is created
+                upon first use.
         """
         if tiledb_ctx is not None and tiledb_config is not None:
             raise ValueError(
@@ -128,6 +136,8 @@ class SOMATileDBContext:
         self._tiledb_ctx = tiledb_ctx
         """The TileDB context to use, either provided or lazily constructed."""
         self._timestamp_ms = _maybe_timestamp_ms(timestamp)
+        self._threadpool = threadpool
+        """The thread pool to use, either provided or lazily constructed."""
 
     @property
     def timestamp_ms(self) -> Optional[int]:
@@ -158,6 +168,14 @@ class SOMATileDBContext:
                     self._tiledb_ctx = tiledb.Ctx(self._initial_config)
             return self._tiledb_ctx
 
+    @property
+    def threadpool(self) -> ThreadPoolExecutor:
+        """The thread pool for concurrent operations under this SOMA context."""
+        with self._lock:
+            if self._threadpool is None:
+                self._threadpool = ThreadPoolExecutor()
+            return self._threadpool
+
     @property
     def tiledb_config(self) -> Dict[str, Union[str, float]]:
         """The TileDB configuration dictionary for this SOMA context.
@@ -195,6 +213,7 @@ class SOMATileDBContext:
         tiledb_config: Optional[Dict[str, Any]] = None,
         tiledb_ctx: Optional[tiledb.Ctx] = None,
         timestamp: Optional[OpenTimestamp] = _SENTINEL,  # type: ignore[assignment]
+        threadpool: Optional[ThreadPoolExecutor] = _SENTINEL,  # type: ignore[assignment]
     ) -> Self:
         """Create a copy of the context, merging changes.
 
@@ -210,6 +229,9 @@ class SOMATileDBContext:
                 Explicitly passing ``None`` will remove the timestamp.
                 For details, see the description of ``timestamp``
                 in :meth:`__init__`.
+            threadpool:
+                A thread pool to replace the current thread pool with.
+                Explicitly passing ``None`` will use a new default pool.
 
         Lifecycle:
             Experimental.
@@ -234,8 +256,14 @@ class SOMATileDBContext:
             if timestamp is _SENTINEL:
                 # Keep the existing timestamp if not overridden.
                 timestamp = self._timestamp_ms
+            if threadpool is _SENTINEL:
+                # Keep the existing thread pool if not overridden.
+                threadpool = self._threadpool
         return type(self)(
-            tiledb_config=tiledb_config, tiledb_ctx=tiledb_ctx, timestamp=timestamp
+            tiledb_config=tiledb_config,
+            tiledb_ctx=tiledb_ctx,
+            timestamp=timestamp,
+            threadpool=threadpool,
         )
 
     def _open_timestamp_ms(self, in_timestamp: Optional[OpenTimestamp]) -> int:
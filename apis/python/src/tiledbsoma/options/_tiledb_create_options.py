@@ -14,6 +14,7 @@ from typing import (
 
 import attrs as attrs_  # We use the name `attrs` later.
 import attrs.validators as vld  # Short name because we use this a bunch.
+import numpy as np
 import tiledb
 from somacore import options
 from typing_extensions import Self, TypedDict
@@ -94,6 +95,36 @@ def _normalize_columns(
     }
 
 
+# Numeric types TileDB can store as an attribute. Platform-dependent types
+# (``longdouble``) and float16 are not among them.
+_VALUE_TYPES = frozenset(
+    np.dtype(t)
+    for t in (
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+        "float32",
+        "float64",
+    )
+)
+
+
+def _validate_value_type(
+    inst: object, attr: "attrs_.Attribute[Any]", value: Any
+) -> None:
+    try:
+        dtype = np.dtype(value)
+    except TypeError as e:
+        raise ValueError(f"{attr.name}: {value!r} is not a numpy dtype") from e
+    if dtype not in _VALUE_TYPES:
+        raise ValueError(f"{attr.name}: unsupported value type {value!r}")
+
+
 @attrs_.define(frozen=True, kw_only=True, slots=True)
 class TileDBCreateOptions:
     """Tuning options used when creating new TileDB arrays for SOMA data.
@@ -131,6 +162,12 @@ class TileDBCreateOptions:
         validator=vld.instance_of(bool),
         default=False,
     )
+    # If set, a numeric numpy dtype name (e.g. ``"float32"``) that obsp/varp values
+    # are cast to on ingest. Unset (the default) keeps the input's value type.
+    obsp_varp_value_type: Optional[str] = attrs_.field(
+        validator=vld.optional(vld.and_(vld.instance_of(str), _validate_value_type)),
+        default=None,
+    )
     tile_order: Optional[str] = attrs_.field(
         validator=vld.optional(vld.instance_of(str)), default=None
     )
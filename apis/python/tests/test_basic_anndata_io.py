@@ -2,17 +2,20 @@ import pathlib
 import tempfile
 from pathlib import Path
 from typing import Optional
+from unittest import mock
 
 import anndata
 import numpy as np
 import pandas as pd
 import pytest
+import scipy.sparse as sp
 import somacore
 import tiledb
 
 import tiledbsoma
 import tiledbsoma.io
 from tiledbsoma import _constants, _factory
+from tiledbsoma.io import ingest
 
 HERE = Path(__file__).parent
 
@@ -309,6 +312,55 @@ def test_resume_mode(adata, resume_mode_h5ad_file):
                 )
 
 
+@pytest.mark.parametrize(
+    "sparse_X_h5ad_file",
+    [
+        HERE.parent / "testdata/pbmc-small-x-csr.h5ad",
+        HERE.parent / "testdata/pbmc-small-x-csc.h5ad",
+    ],
+)
+def test_ingest_backed_sparse_X_unchunked(tmp_path, sparse_X_h5ad_file):
+    """
+    Makes sure a backed (``SparseDataset``) X is written correctly when written all at once,
+    rather than chunked.
+    """
+    output_path = tmp_path.as_posix()
+    tiledbsoma.io.from_h5ad(
+        output_path,
+        sparse_X_h5ad_file.as_posix(),
+        "RNA",
+        platform_config={"tiledb": {"create": {"write_X_chunked": False}}},
+    )
+
+    orig = anndata.read_h5ad(sparse_X_h5ad_file)
+    with tiledbsoma.Experiment.open(output_path) as exp:
+        table = exp.ms["RNA"].X["data"].read().tables().concat()
+    readback = sp.csr_matrix(
+        (
+            table["soma_data"].to_numpy(),
+            (table["soma_dim_0"].to_numpy(), table["soma_dim_1"].to_numpy()),
+        ),
+        shape=orig.shape,
+    )
+    assert (readback != sp.csr_matrix(orig.X)).nnz == 0
+
+
+def test_ingest_trailing_slash_uri(adata, tmp_path):
+    """An experiment URI given with a trailing slash ingests and reads back as usual."""
+    output_path = tmp_path.as_posix()
+    tiledbsoma.io.from_anndata(output_path + "/", adata, "RNA")
+
+    with tiledbsoma.Experiment.open(output_path) as exp:
+        assert "RNA" in exp.ms
+        assert not exp.ms.uri.endswith("//ms")
+        readback = tiledbsoma.io.to_anndata(exp, measurement_name="RNA")
+
+    assert readback.shape == adata.shape
+    assert list(readback.obs_names) == list(adata.obs_names)
+    assert list(readback.var_names) == list(adata.var_names)
+    assert sorted(readback.obsp.keys()) == sorted(adata.obsp.keys())
+
+
 @pytest.mark.parametrize("use_relative_uri", [False, True, None])
 def test_ingest_relative(h5ad_file_extended, use_relative_uri):
     tempdir = tempfile.TemporaryDirectory()
@@ -590,6 +642,11 @@ def test_export_anndata(adata):
     tempdir = tempfile.TemporaryDirectory()
     output_path = tempdir.name
 
+    # pbmc-small has no varp; add one so that its values are checked too.
+    adata.varp["random"] = sp.random(
+        adata.n_vars, adata.n_vars, density=0.05, format="csr", random_state=1
+    )
+
     tiledbsoma.io.from_anndata(output_path, adata, measurement_name="RNA")
 
     with _factory.open(output_path) as exp:
@@ -623,6 +680,42 @@ def test_export_anndata(adata):
     for key in adata.varp.keys():
         assert readback.varp[key].shape == adata.varp[key].shape
 
+    # Values, not just shapes, must survive the round trip.
+    assert (sp.csr_matrix(readback.X) != sp.csr_matrix(adata.X)).nnz == 0
+    for key in adata.obsp.keys():
+        assert (
+            sp.csr_matrix(readback.obsp[key]) != sp.csr_matrix(adata.obsp[key])
+        ).nnz == 0
+    for key in adata.varp.keys():
+        assert (
+            sp.csr_matrix(readback.varp[key]) != sp.csr_matrix(adata.varp[key])
+        ).nnz == 0
+
+
+def test_obsp_write_failure(adata, tmp_path: Path):
+    """
+    If one obsp matrix fails to write, the others are still written and added to the
+    collection, and the error is propagated.
+    """
+    output_path = tmp_path.as_posix()
+    adata.obsp["failing"] = adata.obsp["distances"].copy()
+
+    create_from_matrix = ingest._create_from_matrix
+
+    def _create_or_fail(cls, uri, matrix, **kwargs):
+        if uri.endswith("/failing"):
+            raise RuntimeError("injected failure")
+        return create_from_matrix(cls, uri, matrix, **kwargs)
+
+    with mock.patch.object(ingest, "_create_from_matrix", side_effect=_create_or_fail):
+        with pytest.raises(RuntimeError, match="injected failure"):
+            tiledbsoma.io.from_anndata(output_path, adata, measurement_name="RNA")
+
+    with tiledbsoma.Experiment.open(output_path) as exp:
+        obsp = exp.ms["RNA"].obsp
+        assert list(obsp.keys()) == ["distances"]
+        assert obsp["distances"].nnz == adata.obsp["distances"].nnz
+
 
 def test_null_obs(adata, tmp_path: Path):
     output_path = tmp_path.as_uri()
@@ -1,5 +1,6 @@
 import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -117,3 +118,16 @@ def test_replace_config_after_construction():
         new_tdb_ctx = new_soma_ctx.tiledb_ctx
         mock_ctx.assert_called_once()
         assert new_tdb_ctx.config()["vfs.s3.region"] == "us-west-2"
+
+
+def test_threadpool():
+    context = stc.SOMATileDBContext()
+    assert context._threadpool is None
+    # Invoke the @property twice to ensure we only build one pool.
+    assert context.threadpool is context.threadpool
+    assert context.replace(timestamp=1).threadpool is context.threadpool
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    pool_context = context.replace(threadpool=pool)
+    assert pool_context.threadpool is pool
+    assert pool_context.replace(threadpool=None).threadpool is not pool
@@ -0,0 +1,87 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+import scipy.sparse as sp
+
+from tiledbsoma.io import conversions
+
+
+def _coo_table(data, dim_0, dim_1):
+    return pa.Table.from_pydict(
+        {
+            "soma_dim_0": pa.array(dim_0, type=pa.int64()),
+            "soma_dim_1": pa.array(dim_1, type=pa.int64()),
+            "soma_data": pa.array(data, type=pa.float64()),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "data,dim_0,dim_1",
+    [
+        # Row-sorted
+        ([1.0, 2.0, 3.0, 4.0], [0, 0, 1, 3], [1, 4, 0, 2]),
+        # Unsorted
+        ([4.0, 1.0, 3.0, 2.0], [3, 0, 1, 0], [2, 1, 0, 4]),
+        # Rows sorted, columns not sorted within a row
+        ([2.0, 1.0, 3.0], [0, 0, 2], [4, 1, 3]),
+        # Duplicate coordinates, row-sorted
+        ([1.0, 2.0, 3.0, 4.0], [0, 0, 0, 2], [1, 1, 3, 0]),
+        # Duplicate coordinates, unsorted
+        ([1.0, 2.0, 3.0, 4.0], [2, 0, 2, 0], [0, 1, 0, 1]),
+        # Empty
+        ([], [], []),
+    ],
+)
+def test_csr_from_tiledb_tables(data, dim_0, dim_1):
+    shape = (4, 5)
+    expected = sp.coo_matrix((data, (dim_0, dim_1)), shape=shape).tocsr()
+    expected.sum_duplicates()
+
+    table = _coo_table(data, dim_0, dim_1)
+    for actual in (
+        conversions.csr_from_tiledb_table(table, *shape),
+        conversions.csr_from_tiledb_tables([table], *shape),
+        # The same cells, split across several batches
+        conversions.csr_from_tiledb_tables(
+            [pa.Table.from_batches([b]) for b in table.to_batches(max_chunksize=1)],
+            *shape,
+        ),
+    ):
+        assert isinstance(actual, sp.csr_matrix)
+        assert actual.shape == shape
+        assert actual.nnz == expected.nnz
+        assert np.array_equal(actual.toarray(), expected.toarray())
+
+
+def test_csr_from_tiledb_tables_duplicates_summed():
+    table = _coo_table([1.0, 2.0, 3.0], [0, 0, 1], [1, 1, 2])
+    actual = conversions.csr_from_tiledb_tables([table], 2, 3)
+    # Duplicates must be summed even on the row-sorted fast path.
+    assert actual.has_canonical_format
+    assert actual.nnz == 2
+    assert actual[0, 1] == 3.0
+    assert actual[1, 2] == 3.0
+
+
+def test_csr_from_tiledb_tables_no_batches():
+    actual = conversions.csr_from_tiledb_tables([], 3, 4)
+    assert actual.shape == (3, 4)
+    assert actual.nnz == 0
+
+
+@pytest.mark.parametrize(
+    "dim_0,dim_1",
+    [
+        # Row-sorted, column out of range
+        ([0, 1], [1, 9]),
+        # Row-sorted, row out of range
+        ([0, 7], [1, 2]),
+        # Unsorted, column out of range
+        ([1, 0], [9, 1]),
+    ],
+)
+def test_csr_from_tiledb_tables_out_of_range(dim_0, dim_1):
+    table = _coo_table([1.0, 2.0], dim_0, dim_1)
+    with pytest.raises(ValueError):
+        conversions.csr_from_tiledb_tables([table], 3, 4)
@@ -127,3 +127,73 @@ def test_io_create_from_matrix_Sparse_nd_array(
 
         # fast equality check using __ne__
         assert (sp.csr_matrix(src_matrix) != read_back).nnz == 0
+
+
+def _matrix_with_duplicates(format):
+    # Cells (0, 1) and (2, 0) are each given twice.
+    data = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+    if format == "coo":
+        return sp.coo_matrix((data, ([0, 0, 2, 1, 2], [1, 1, 0, 3, 0])), shape=(3, 4))
+    if format == "csr":
+        # Built from (data, indices, indptr), which does not sum duplicates.
+        return sp.csr_matrix((data, [1, 1, 3, 0, 0], [0, 2, 3, 5]), shape=(3, 4))
+    return sp.csc_matrix((data, [2, 2, 0, 0, 1], [0, 2, 4, 4, 5]), shape=(3, 4))
+
+
+@pytest.mark.parametrize(
+    "format,write_X_chunked",
+    [
+        ("coo", False),
+        ("csr", False),
+        ("csr", True),
+        ("csc", False),
+        ("csc", True),
+    ],
+)
+def test_io_create_from_matrix_sums_duplicates(tmp_path, format, write_X_chunked):
+    """Duplicate input coordinates are written once, with their values summed."""
+    src_matrix = _matrix_with_duplicates(format)
+    expected = src_matrix.toarray()  # Sums duplicates
+    somaio.create_from_matrix(
+        soma.SparseNDArray,
+        tmp_path.as_posix(),
+        src_matrix,
+        platform_config={"tiledb": {"create": {"write_X_chunked": write_X_chunked}}},
+    ).close()
+    # The caller's matrix is left as it was.
+    assert src_matrix.nnz == 5
+
+    with _factory.open(tmp_path.as_posix()) as snda:
+        tbl = snda.read().tables().concat()
+
+    assert len(tbl) == np.count_nonzero(expected)
+    read_back = np.zeros_like(expected)
+    read_back[
+        tbl.column("soma_dim_0").to_numpy(), tbl.column("soma_dim_1").to_numpy()
+    ] = tbl.column("soma_data").to_numpy()
+    assert np.array_equal(read_back, expected)
+
+
+@pytest.mark.parametrize("write_X_chunked", [False, True])
+def test_io_create_from_matrix_allows_duplicates(tmp_path, write_X_chunked):
+    """With allows_duplicates, duplicate input coordinates are written as given."""
+    src_matrix = _matrix_with_duplicates("csr")
+    somaio.create_from_matrix(
+        soma.SparseNDArray,
+        tmp_path.as_posix(),
+        src_matrix,
+        platform_config={
+            "tiledb": {
+                "create": {
+                    "allows_duplicates": True,
+                    "write_X_chunked": write_X_chunked,
+                }
+            }
+        },
+    ).close()
+
+    with _factory.open(tmp_path.as_posix()) as snda:
+        tbl = snda.read().tables().concat()
+
+    assert len(tbl) == src_matrix.nnz
+    assert sorted(tbl.column("soma_data").to_pylist()) == sorted(src_matrix.data)
@@ -12,6 +12,8 @@ from tiledbsoma import _factory
 Metadata handling tests for all SOMA foundational datatypes.
 """
 
+SOMA_PREFIX = "soma_"
+
 
 @pytest.fixture(
     scope="function",
@@ -58,7 +60,9 @@ def test_metadata(soma_object):
     uri = soma_object.uri
     with soma_object:
         assert non_soma_metadata(soma_object) == {}
-        non_soma_keys = [k for k in soma_object.metadata if not k.startswith("soma_")]
+        non_soma_keys = [
+            k for k in soma_object.metadata if not k.startswith(SOMA_PREFIX)
+        ]
         assert non_soma_keys == []
         as_dict = dict(soma_object.metadata)
         assert frozenset(soma_object.metadata) == frozenset(as_dict)
@@ -168,7 +172,7 @@ def test_set_delete_metadata(soma_object):
 
 
 def non_soma_metadata(obj) -> Dict[str, Any]:
-    return {k: v for (k, v) in obj.metadata.items() if not k.startswith("soma_")}
+    return {k: v for (k, v) in obj.metadata.items() if not k.startswith(SOMA_PREFIX)}
 
 
 @pytest.mark.parametrize(
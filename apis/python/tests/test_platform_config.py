@@ -2,6 +2,8 @@ import tempfile
 from pathlib import Path
 
 import anndata
+import numpy as np
+import pyarrow as pa
 import pytest
 import tiledb
 
@@ -75,6 +77,45 @@ def test_platform_config(adata):
             assert var_arr.dim("soma_joinid").filters == [tiledb.ZstdFilter(level=1)]
 
 
+@pytest.mark.parametrize("backed", [False, True])
+def test_obsp_varp_value_type(h5ad_file, adata, backed):
+    platform_config = {"tiledb": {"create": {"obsp_varp_value_type": "float32"}}}
+    with tempfile.TemporaryDirectory() as output_path:
+        if backed:
+            # from_h5ad reads the input in backed mode.
+            tiledbsoma.io.from_h5ad(
+                output_path,
+                h5ad_file.as_posix(),
+                "RNA",
+                platform_config=platform_config,
+            )
+        else:
+            tiledbsoma.io.from_anndata(
+                output_path, adata, "RNA", platform_config=platform_config
+            )
+
+        with tiledbsoma.Experiment.open(output_path) as exp:
+            obsp = exp.ms["RNA"].obsp
+            assert sorted(obsp.keys()) == sorted(adata.obsp.keys())
+            for key in obsp.keys():
+                assert obsp[key].schema.field("soma_data").type == pa.float32()
+                table = obsp[key].read().tables().concat()
+                assert table["soma_data"].type == pa.float32()
+                assert np.allclose(
+                    sorted(table["soma_data"].to_numpy()),
+                    sorted(adata.obsp[key].data.astype(np.float32)),
+                )
+            assert exp.ms["RNA"].obsm["X_pca"].schema.field(
+                "soma_data"
+            ).type == pa.from_numpy_dtype(adata.obsm["X_pca"].dtype)
+
+
+@pytest.mark.parametrize("value_type", ["nonsense", "float16", "float128", "U8"])
+def test_obsp_varp_value_type_invalid(value_type):
+    with pytest.raises(ValueError):
+        tco.TileDBCreateOptions(obsp_varp_value_type=value_type)
+
+
 def test__from_platform_config__admits_ignored_config_structure():
     try:
         tco.TileDBCreateOptions.from_platform_config(